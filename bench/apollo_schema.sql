@@ -0,0 +1,93 @@
+-- Tables of an Apollo 2.5 database, as used by migrate.py (columns, primary keys, foreign keys and main indexes)
+
+CREATE SEQUENCE hibernate_sequence START WITH 1 INCREMENT BY 1;
+
+CREATE TABLE grails_user (id bigint PRIMARY KEY, version bigint NOT NULL, first_name varchar(255) NOT NULL, last_name varchar(255) NOT NULL, password_hash varchar(255) NOT NULL, username varchar(255) NOT NULL UNIQUE, metadata text, inactive boolean NOT NULL DEFAULT false);
+CREATE TABLE db (id bigint PRIMARY KEY, version bigint NOT NULL, description varchar(255), name varchar(255) NOT NULL, url varchar(255), url_prefix varchar(255));
+CREATE TABLE cv (id bigint PRIMARY KEY, version bigint NOT NULL, definition text, name varchar(255) NOT NULL);
+CREATE TABLE analysis (id bigint PRIMARY KEY, version bigint NOT NULL, algorithm varchar(255), description text, name varchar(255), program varchar(255) NOT NULL, program_version varchar(255) NOT NULL, source_name varchar(255), source_uri varchar(255), source_version varchar(255), time_executed timestamp NOT NULL);
+CREATE TABLE allele (id bigint PRIMARY KEY, version bigint NOT NULL, bases varchar(255) NOT NULL, reference boolean NOT NULL, variant_id bigint);
+CREATE TABLE allele_info (id bigint PRIMARY KEY, version bigint NOT NULL, allele_id bigint NOT NULL REFERENCES allele (id), tag varchar(255) NOT NULL, value text);
+CREATE TABLE dbxref (id bigint PRIMARY KEY, version bigint NOT NULL, accession varchar(255) NOT NULL, db_id bigint NOT NULL REFERENCES db (id), description varchar(255));
+CREATE TABLE cvterm (id bigint PRIMARY KEY, version bigint NOT NULL, cv_id bigint NOT NULL REFERENCES cv (id), dbxref_id bigint REFERENCES dbxref (id), definition text, is_obsolete integer NOT NULL, is_relationship_type integer NOT NULL, name varchar(1024) NOT NULL);
+CREATE TABLE publication (id bigint PRIMARY KEY, version bigint NOT NULL, is_obsolete boolean, issue varchar(255), mini_reference varchar(255), pages varchar(255), publication_place varchar(255), publication_year varchar(255), publisher varchar(255), series_name varchar(255), title varchar(255), type_id bigint REFERENCES cvterm (id), unique_name varchar(255) NOT NULL, volume varchar(255), volume_title varchar(255));
+CREATE TABLE feature (id bigint PRIMARY KEY, version bigint NOT NULL, class varchar(255) NOT NULL, date_created timestamp, dbxref_id bigint REFERENCES dbxref (id), description text, is_analysis boolean NOT NULL, is_obsolete boolean NOT NULL, last_updated timestamp, md5checksum varchar(255), name varchar(255) NOT NULL, sequence_length integer, status_id bigint, symbol varchar(255), unique_name varchar(255) NOT NULL, reference_allele_id bigint REFERENCES allele (id), alteration_residue varchar(255), deletion_length integer);
+CREATE INDEX feature_unique_name_idx ON feature (unique_name);
+CREATE TABLE analysis_feature (id bigint PRIMARY KEY, version bigint NOT NULL, analysis_id bigint NOT NULL REFERENCES analysis (id), feature_id bigint REFERENCES feature (id), identity double precision, normalized_score double precision, raw_score double precision, significance double precision);
+CREATE TABLE feature_property (id bigint PRIMARY KEY, version bigint NOT NULL, class varchar(255) NOT NULL, feature_id bigint NOT NULL REFERENCES feature (id), rank integer NOT NULL, tag varchar(255), type_id bigint REFERENCES cvterm (id), value text NOT NULL);
+ALTER TABLE feature ADD CONSTRAINT feature_status_fk FOREIGN KEY (status_id) REFERENCES feature_property (id);
+ALTER TABLE allele ADD CONSTRAINT allele_variant_fk FOREIGN KEY (variant_id) REFERENCES feature (id);
+CREATE TABLE feature_dbxref (feature_featuredbxrefs_id bigint NOT NULL REFERENCES feature (id), dbxref_id bigint NOT NULL REFERENCES dbxref (id));
+CREATE TABLE feature_grails_user (feature_owners_id bigint NOT NULL REFERENCES feature (id), user_id bigint NOT NULL REFERENCES grails_user (id));
+CREATE TABLE feature_relationship (id bigint PRIMARY KEY, version bigint NOT NULL, child_feature_id bigint NOT NULL REFERENCES feature (id), parent_feature_id bigint NOT NULL REFERENCES feature (id), rank integer NOT NULL, value varchar(255));
+CREATE INDEX feature_relationship_parent_idx ON feature_relationship (parent_feature_id);
+CREATE INDEX feature_relationship_child_idx ON feature_relationship (child_feature_id);
+CREATE TABLE phenotype (id bigint PRIMARY KEY, version bigint NOT NULL, assay_id bigint REFERENCES cvterm (id), attribute_id bigint REFERENCES cvterm (id), cvalue_id bigint REFERENCES cvterm (id), observable_id bigint REFERENCES cvterm (id), unique_name varchar(255) NOT NULL, value varchar(255));
+CREATE TABLE feature_feature_phenotypes (feature_id bigint NOT NULL REFERENCES feature (id), phenotype_id bigint NOT NULL REFERENCES phenotype (id));
+CREATE TABLE environment (id bigint PRIMARY KEY, version bigint NOT NULL, description varchar(255), unique_name varchar(255) NOT NULL);
+CREATE TABLE genotype (id bigint PRIMARY KEY, version bigint NOT NULL, description varchar(255), genotype_id integer, name varchar(255), unique_name varchar(255) NOT NULL);
+CREATE TABLE feature_genotype (id bigint PRIMARY KEY, version bigint NOT NULL, cgroup integer NOT NULL, chromosome_feature_id bigint NOT NULL REFERENCES feature (id), cvterm_id bigint NOT NULL REFERENCES cvterm (id), feature_id bigint NOT NULL REFERENCES feature (id), genotype_id bigint NOT NULL REFERENCES genotype (id), rank integer NOT NULL);
+CREATE TABLE phenotype_statement (id bigint PRIMARY KEY, version bigint NOT NULL, environment_id bigint NOT NULL REFERENCES environment (id), genotype_id bigint NOT NULL REFERENCES genotype (id), phenotype_id bigint NOT NULL REFERENCES phenotype (id), publication_id bigint NOT NULL REFERENCES publication (id), type_id bigint NOT NULL REFERENCES cvterm (id));
+CREATE TABLE phenotype_cvterm (phenotype_phenotypecvterms_id bigint NOT NULL REFERENCES phenotype (id), cvterm_id bigint NOT NULL REFERENCES cvterm (id));
+CREATE TABLE variant_info (id bigint PRIMARY KEY, version bigint NOT NULL, tag varchar(255) NOT NULL, value text, variant_id bigint NOT NULL REFERENCES feature (id));
+CREATE TABLE synonym (id bigint PRIMARY KEY, version bigint NOT NULL, name varchar(255) NOT NULL, synonymsgml varchar(255), type_id bigint REFERENCES cvterm (id));
+CREATE TABLE feature_synonym (id bigint PRIMARY KEY, version bigint NOT NULL, feature_id bigint NOT NULL REFERENCES feature (id), feature_synonyms_id bigint REFERENCES feature (id), is_current boolean NOT NULL, is_internal boolean NOT NULL, publication_id bigint REFERENCES publication (id), synonym_id bigint NOT NULL REFERENCES synonym (id));
+CREATE TABLE featurecvterm (id bigint PRIMARY KEY, version bigint NOT NULL, cvterm_id bigint NOT NULL REFERENCES cvterm (id), feature_id bigint NOT NULL REFERENCES feature (id), is_not boolean NOT NULL, publication_id bigint REFERENCES publication (id), rank integer NOT NULL);
+CREATE TABLE go_annotation (id bigint PRIMARY KEY, version bigint NOT NULL, aspect varchar(255) NOT NULL, date_created timestamp, evidence_ref varchar(255) NOT NULL, evidence_ref_label varchar(255), feature_id bigint NOT NULL REFERENCES feature (id), gene_product_relationship_ref varchar(255), go_ref varchar(255) NOT NULL, go_ref_label varchar(255), is_negate boolean NOT NULL, last_updated timestamp, notes text, reference varchar(255) NOT NULL, with_or_from_array text);
+CREATE TABLE go_annotation_grails_user (go_annotation_owners_id bigint NOT NULL REFERENCES go_annotation (id), user_id bigint NOT NULL REFERENCES grails_user (id));
+CREATE TABLE organism (id bigint PRIMARY KEY, version bigint NOT NULL, abbreviation varchar(255), blatdb varchar(255), comment varchar(255), common_name varchar(255) NOT NULL, data_added_via_web_services boolean, directory varchar(255) NOT NULL, genome_fasta varchar(255), genome_fasta_index varchar(255), genus varchar(255), metadata text, non_default_translation_table varchar(255), obsolete boolean NOT NULL DEFAULT false, official_gene_set_track varchar(255), public_mode boolean NOT NULL, species varchar(255), valid boolean);
+CREATE TABLE sequence (id bigint PRIMARY KEY, version bigint NOT NULL, sequence_end integer NOT NULL, length integer NOT NULL, name varchar(255) NOT NULL, organism_id bigint REFERENCES organism (id), seq_chunk_size integer, sequence_start integer NOT NULL);
+CREATE INDEX sequence_organism_idx ON sequence (organism_id);
+CREATE TABLE feature_location (id bigint PRIMARY KEY, version bigint NOT NULL, feature_id bigint NOT NULL REFERENCES feature (id), fmax integer NOT NULL, fmin integer NOT NULL, is_fmax_partial boolean NOT NULL, is_fmin_partial boolean NOT NULL, locgroup integer NOT NULL, phase integer, rank integer NOT NULL, residue_info varchar(255), sequence_id bigint NOT NULL REFERENCES sequence (id), strand integer);
+CREATE INDEX feature_location_feature_idx ON feature_location (feature_id);
+CREATE INDEX feature_location_sequence_idx ON feature_location (sequence_id);
+CREATE TABLE feature_publication (feature_id bigint NOT NULL REFERENCES feature (id), publication_id bigint NOT NULL REFERENCES publication (id));
+CREATE TABLE feature_location_publication (feature_location_feature_location_publications_id bigint NOT NULL REFERENCES feature_location (id), publication_id bigint NOT NULL REFERENCES publication (id));
+CREATE TABLE sequence_chunk (id bigint PRIMARY KEY, version bigint NOT NULL, chunk_number integer NOT NULL, residue text NOT NULL, sequence_id bigint NOT NULL REFERENCES sequence (id));
+CREATE INDEX sequence_chunk_sequence_idx ON sequence_chunk (sequence_id, chunk_number);
+CREATE TABLE organismdbxref (id bigint PRIMARY KEY, version bigint NOT NULL, dbxref_id bigint NOT NULL REFERENCES dbxref (id), organism_id bigint NOT NULL REFERENCES organism (id));
+CREATE TABLE preference (id bigint PRIMARY KEY, version bigint NOT NULL, class varchar(255) NOT NULL, client_token varchar(255), current_organism boolean, date_created timestamp, domain varchar(255), end_bp integer, last_updated timestamp, name varchar(255), native_track_list boolean, organism_id bigint REFERENCES organism (id), preferences_string text, sequence_id bigint REFERENCES sequence (id), start_bp integer, user_id bigint REFERENCES grails_user (id));
+CREATE TABLE featurecvterm_publication (featurecvterm_id bigint NOT NULL REFERENCES featurecvterm (id), publication_id bigint NOT NULL REFERENCES publication (id));
+CREATE TABLE featurecvterm_dbxref (featurecvterm_id bigint NOT NULL REFERENCES featurecvterm (id), dbxref_id bigint NOT NULL REFERENCES dbxref (id));
+CREATE TABLE feature_property_publication (feature_property_feature_property_publications_id bigint NOT NULL REFERENCES feature_property (id), publication_id bigint NOT NULL REFERENCES publication (id));
+CREATE TABLE feature_relationship_feature_property (feature_relationship_feature_relationship_properties_id bigint NOT NULL REFERENCES feature_relationship (id), feature_property_id bigint NOT NULL REFERENCES feature_property (id));
+CREATE TABLE user_group (id bigint PRIMARY KEY, version bigint NOT NULL, metadata text, name varchar(255) NOT NULL UNIQUE, public_group boolean NOT NULL);
+CREATE TABLE user_group_users (user_group_id bigint NOT NULL REFERENCES user_group (id), user_id bigint NOT NULL REFERENCES grails_user (id), PRIMARY KEY (user_id, user_group_id));
+CREATE TABLE user_group_admin (user_group_id bigint NOT NULL REFERENCES user_group (id), user_id bigint NOT NULL REFERENCES grails_user (id), PRIMARY KEY (user_group_id, user_id));
+CREATE TABLE role (id bigint PRIMARY KEY, version bigint NOT NULL, name varchar(255) NOT NULL UNIQUE, rank integer);
+CREATE TABLE role_permissions (role_id bigint REFERENCES role (id), permissions_string varchar(255));
+CREATE TABLE grails_user_roles (role_id bigint NOT NULL REFERENCES role (id), user_id bigint NOT NULL REFERENCES grails_user (id), PRIMARY KEY (user_id, role_id));
+CREATE TABLE permission (id bigint PRIMARY KEY, version bigint NOT NULL, class varchar(255) NOT NULL, group_id bigint REFERENCES user_group (id), organism_id bigint NOT NULL REFERENCES organism (id), permissions varchar(255) NOT NULL, track_visibilities varchar(255), user_id bigint REFERENCES grails_user (id));
+CREATE TABLE organism_property (id bigint PRIMARY KEY, version bigint NOT NULL, abbreviation varchar(255), comment varchar(255), common_name varchar(255) NOT NULL, genus varchar(255), species varchar(255));
+CREATE TABLE organism_organism_property (organism_id bigint NOT NULL REFERENCES organism (id), organism_organism_property_id bigint NOT NULL REFERENCES organism_property (id));
+CREATE TABLE organism_property_organism_property (organism_property_organism_properties_id bigint NOT NULL REFERENCES organism_property (id), organism_property_id bigint NOT NULL REFERENCES organism_property (id));
+CREATE TABLE organism_property_organismdbxref (organism_property_organismdbxrefs_id bigint NOT NULL REFERENCES organism_property (id), organismdbxref_id bigint NOT NULL REFERENCES organismdbxref (id));
+CREATE TABLE feature_event (id bigint PRIMARY KEY, version bigint NOT NULL, child_id bigint, child_split_id bigint, current boolean NOT NULL, date_created timestamp NOT NULL, editor_id bigint REFERENCES grails_user (id), last_updated timestamp NOT NULL, name varchar(255) NOT NULL, new_features_json_array text, old_features_json_array text, operation varchar(255) NOT NULL, original_json_command text, parent_id bigint, parent_merge_id bigint, unique_name varchar(255) NOT NULL);
+CREATE INDEX feature_event_unique_name_idx ON feature_event (unique_name);
+CREATE TABLE feature_type (id bigint PRIMARY KEY, version bigint NOT NULL, display varchar(255) NOT NULL, name varchar(255) NOT NULL, ontology_id varchar(255) NOT NULL, type varchar(255) NOT NULL);
+CREATE TABLE canned_comment (id bigint PRIMARY KEY, version bigint NOT NULL, comment text NOT NULL, metadata text);
+CREATE TABLE canned_comment_feature_type (canned_comment_feature_types_id bigint REFERENCES canned_comment (id), feature_type_id bigint REFERENCES feature_type (id));
+CREATE TABLE available_status (id bigint PRIMARY KEY, version bigint NOT NULL, value text NOT NULL, metadata text);
+CREATE TABLE available_status_feature_type (available_status_feature_types_id bigint REFERENCES available_status (id), feature_type_id bigint REFERENCES feature_type (id));
+CREATE TABLE suggested_name (id bigint PRIMARY KEY, version bigint NOT NULL, name text NOT NULL, metadata text);
+CREATE TABLE suggested_name_feature_type (suggested_name_feature_types_id bigint REFERENCES suggested_name (id), feature_type_id bigint REFERENCES feature_type (id));
+CREATE TABLE canned_value (id bigint PRIMARY KEY, version bigint NOT NULL, label text NOT NULL, metadata text);
+CREATE TABLE canned_value_feature_type (canned_value_feature_types_id bigint REFERENCES canned_value (id), feature_type_id bigint REFERENCES feature_type (id));
+CREATE TABLE canned_key (id bigint PRIMARY KEY, version bigint NOT NULL, label text NOT NULL, metadata text);
+CREATE TABLE canned_key_feature_type (canned_key_feature_types_id bigint REFERENCES canned_key (id), feature_type_id bigint REFERENCES feature_type (id));
+CREATE TABLE organism_filter (id bigint PRIMARY KEY, version bigint NOT NULL, class varchar(255) NOT NULL, organism_id bigint NOT NULL REFERENCES organism (id), canned_key_id bigint REFERENCES canned_key (id), canned_value_id bigint REFERENCES canned_value (id), canned_comment_id bigint REFERENCES canned_comment (id), suggested_name_id bigint REFERENCES suggested_name (id), available_status_id bigint REFERENCES available_status (id));
+CREATE TABLE analysis_property (id bigint PRIMARY KEY, version bigint NOT NULL, analysis_id bigint REFERENCES analysis (id), type_id bigint REFERENCES cvterm (id), value varchar(255));
+CREATE TABLE operation (id bigint PRIMARY KEY, version bigint NOT NULL, attributes text, feature_unique_name varchar(255) NOT NULL, new_features text, old_features text, operation_type varchar(255) NOT NULL);
+CREATE TABLE reference (id bigint PRIMARY KEY, version bigint NOT NULL, name varchar(255));
+CREATE TABLE custom_domain_mapping (id bigint PRIMARY KEY, version bigint NOT NULL, alternate_cv_term varchar(255), is_transcript boolean, ontology_id varchar(255), so_id varchar(255));
+CREATE TABLE go_term (id bigint PRIMARY KEY, version bigint NOT NULL, name varchar(255) NOT NULL, pref_term varchar(255));
+CREATE TABLE part_of (id bigint PRIMARY KEY, version bigint NOT NULL);
+CREATE TABLE cvterm_path (id bigint PRIMARY KEY, version bigint NOT NULL, cv_id bigint NOT NULL REFERENCES cv (id), distance integer, objectcvterm_id bigint NOT NULL REFERENCES cvterm (id), subjectcvterm_id bigint NOT NULL REFERENCES cvterm (id), type_id bigint REFERENCES cvterm (id));
+CREATE TABLE cvterm_relationship (id bigint PRIMARY KEY, version bigint NOT NULL, objectcvterm_id bigint NOT NULL REFERENCES cvterm (id), subjectcvterm_id bigint NOT NULL REFERENCES cvterm (id), type_id bigint NOT NULL REFERENCES cvterm (id));
+CREATE TABLE dbxref_property (id bigint PRIMARY KEY, version bigint NOT NULL, dbxref_id bigint NOT NULL REFERENCES dbxref (id), rank integer NOT NULL, type_id bigint NOT NULL REFERENCES cvterm (id), value varchar(255) NOT NULL);
+CREATE TABLE environmentcvterm (id bigint PRIMARY KEY, version bigint NOT NULL, cvterm_id bigint NOT NULL REFERENCES cvterm (id), environment_id bigint NOT NULL REFERENCES environment (id));
+CREATE TABLE phenotype_description (id bigint PRIMARY KEY, version bigint NOT NULL, description varchar(255) NOT NULL, environment_id bigint NOT NULL REFERENCES environment (id), genotype_id bigint NOT NULL REFERENCES genotype (id), publication_id bigint NOT NULL REFERENCES publication (id), type_id bigint NOT NULL REFERENCES cvterm (id));
+CREATE TABLE publication_author (id bigint PRIMARY KEY, version bigint NOT NULL, editor boolean, given_names varchar(255), publication_id bigint NOT NULL REFERENCES publication (id), rank integer NOT NULL, suffix varchar(255), surname varchar(255) NOT NULL);
+CREATE TABLE publication_relationship (id bigint PRIMARY KEY, version bigint NOT NULL, cvterm_id bigint NOT NULL REFERENCES cvterm (id), object_publication_id bigint NOT NULL REFERENCES publication (id), subject_publication_id bigint NOT NULL REFERENCES publication (id));
+CREATE TABLE publicationdbxref (id bigint PRIMARY KEY, version bigint NOT NULL, dbxref_id bigint NOT NULL REFERENCES dbxref (id), is_current boolean, publication_id bigint NOT NULL REFERENCES publication (id));
+CREATE TABLE feature_relationship_publication (feature_relationship_feature_relationship_publications_id bigint NOT NULL REFERENCES feature_relationship (id), publication_id bigint NOT NULL REFERENCES publication (id));
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+# Micro-benchmark of the per-row cost of remapping src rows into dest rows:
+# the original per-row/per-column dict building loop vs RowTransformer
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from migrate import IdMap, RowTransformer  # noqa: E402
+
+
+# Columns of the feature table, as in Apollo 2.5
+COLS = ['id', 'version', 'class', 'date_created', 'dbxref_id', 'description', 'is_analysis', 'is_obsolete', 'last_updated', 'md5checksum',
+        'name', 'sequence_length', 'status_id', 'symbol', 'unique_name', 'reference_allele_id', 'alteration_residue', 'deletion_length']
+IGNORE_COLUMNS = ['status_id']
+
+
+def legacy_transform(rows, cols, id_column, ignore_columns, col_mapping, max_id):
+    """
+    The loop used by migrate_table before RowTransformer (with dict id maps)
+    """
+
+    values = []
+    for row in rows:
+        max_id += 1
+        col_values = {}
+        row_id = 0
+        for col in cols:
+            if id_column and col == id_column:
+                col_values[col] = max_id
+            elif col in ignore_columns:
+                col_values[col] = None
+            elif col in col_mapping:
+                if row[row_id] is None:
+                    col_values[col] = None
+                else:
+                    col_values[col] = col_mapping[col][row[row_id]]
+            else:
+                col_values[col] = row[row_id]
+            row_id += 1
+        values.append(tuple([col_values[col] for col in cols]))
+
+    return values
+
+
+def make_rows(count):
+    rows = []
+    for i in range(count):
+        rows.append((i + 1, 0, 'org.bbop.apollo.Gene', '2020-01-01 00:00:00', random.randint(1, 1000) if i % 7 == 0 else None, 'description %s' % i, False, False,
+                     '2020-01-01 00:00:00', None, 'gene%s' % i, 1000, i + 1 if i % 5 == 0 else None, None, 'unique-%s' % i, 1 if i % 100 == 0 else None, None, None))
+    return rows
+
+
+def timed(function, rounds):
+    start = time.perf_counter()
+    for i in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the per-row cost of the legacy remapping loop and RowTransformer")
+    parser.add_argument('--rows', type=int, default=10000, help="Number of rows per batch (default: 10000)")
+    parser.add_argument('--rounds', type=int, default=20, help="Number of batches to time (default: 20)")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+
+    dict_maps = {
+        'dbxref_id': {i: i + 5000 for i in range(1, 1001)},
+        'reference_allele_id': {1: 42},
+    }
+    id_maps = {}
+    for col, mapping in dict_maps.items():
+        id_maps[col] = IdMap()
+        id_maps[col].add(list(mapping.keys()), list(mapping.values()))
+        id_maps[col].compact()
+
+    transformer = RowTransformer(COLS, id_column='id', ignore_columns=IGNORE_COLUMNS, col_mapping=id_maps)
+    new_ids = range(1001, 1001 + len(rows))
+
+    legacy = legacy_transform(rows, COLS, 'id', IGNORE_COLUMNS, dict_maps, 1000)
+    compiled = list(transformer.transform(rows, new_ids)[1])
+    if legacy != compiled:
+        print("Results differ between the two implementations!")
+        sys.exit(1)
+
+    legacy_time = timed(lambda: legacy_transform(rows, COLS, 'id', IGNORE_COLUMNS, dict_maps, 1000), args.rounds)
+    compiled_time = timed(lambda: list(transformer.transform(rows, new_ids)[1]), args.rounds)
+
+    print("%d columns, %d rows per batch" % (len(COLS), len(rows)))
+    print("legacy loop:     %8.0f ns/row" % (legacy_time / len(rows) * 1e9))
+    print("RowTransformer:  %8.0f ns/row" % (compiled_time / len(rows) * 1e9))
+    print("speedup:         %8.1fx" % (legacy_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main()